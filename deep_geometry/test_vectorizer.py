@@ -1,11 +1,13 @@
+import math
 import unittest
 
 import numpy as np
 from shapely import wkt as wktreader
+from shapely.geometry.base import BaseGeometry
 from csv import DictReader
 
 from deep_geometry.vectorizer \
-    import num_points_from_wkt, vectorize_wkt, get_max_points, \
+    import num_points_from_wkt, vectorize_wkt, get_max_points, batch_simplify, recursive_simplify, \
     GEO_VECTOR_LEN, IS_INNER_INDEX, IS_OUTER_INDEX, FULL_STOP_INDEX
 
 TOPOLOGY_CSV = 'test_files/polygon_multipolygon.csv'
@@ -62,6 +64,20 @@ output_geom = np.array([
 non_empty_geom_collection = 'GEOMETRYCOLLECTION(LINESTRING(1 1, 3 5),POLYGON((-1 -1, -1 -5, -5 -5, -5 -1, -1 -1)))'
 
 
+def recursive_simplify_tolerance(max_points: int, shape: BaseGeometry) -> float:
+    """
+    Replays the tolerance search of recursive_simplify and returns the tolerance it ends on
+    """
+    log_tolerance = -10.
+    tolerance = math.pow(10, log_tolerance)
+    shape = shape.simplify(tolerance)
+    while num_points_from_wkt(shape.wkt) > max_points:
+        log_tolerance += 0.5
+        tolerance = math.pow(10, log_tolerance)
+        shape = shape.simplify(tolerance)
+    return tolerance
+
+
 class TestVectorizer(unittest.TestCase):
     def test_num_points_from_multipolygon_with_hole(self) -> None:
         with open('test_files/multipolygon_with_hole.txt', 'r') as file:
@@ -180,3 +196,50 @@ class TestVectorizer(unittest.TestCase):
             max_points = 20
             with self.assertRaises(Exception):
                 vectorize_wkt(geom.wkt, max_points)
+
+    def test_batch_simplify(self) -> None:
+        with open('test_files/multipart_multipolygon_wkt.txt', 'r') as file:
+            wkt = file.read()
+            input_set = [wkt, 'POINT(12 14)', wktreader.loads(wkt).geoms[0].wkt]
+            max_points = [20, 5, 10]
+            simplified, tolerances, removed = batch_simplify(input_set, max_points)
+            self.assertEqual(simplified[1], input_set[1])
+            self.assertEqual(tolerances[1], 0)
+            self.assertEqual(removed[1], 0)
+            for index in [0, 2]:
+                shape = wktreader.loads(input_set[index])
+                expected = recursive_simplify(max_points[index], shape)
+                self.assertTrue(wktreader.loads(simplified[index]).equals_exact(expected, 0))
+                self.assertAlmostEqual(tolerances[index], recursive_simplify_tolerance(max_points[index], shape))
+                self.assertLessEqual(num_points_from_wkt(simplified[index]), max_points[index])
+                self.assertEqual(
+                    removed[index],
+                    num_points_from_wkt(input_set[index]) - num_points_from_wkt(simplified[index]))
+
+    def test_batch_simplify_scalar_max_points(self) -> None:
+        with open('test_files/multipart_multipolygon_wkt.txt', 'r') as file:
+            wkt = file.read()
+            within_budget = 'POLYGON((0 0, 1 0, 1 1, 0 1, 0 0))'
+            max_points = 20
+            simplified, tolerances, removed = batch_simplify([within_budget, wkt], max_points)
+            self.assertEqual(simplified[0], within_budget)
+            self.assertEqual(tolerances[0], 0)
+            self.assertEqual(removed[0], 0)
+            expected = recursive_simplify(max_points, wktreader.loads(wkt))
+            self.assertTrue(wktreader.loads(simplified[1]).equals_exact(expected, 0))
+            self.assertAlmostEqual(tolerances[1], recursive_simplify_tolerance(max_points, wktreader.loads(wkt)))
+
+    def test_batch_simplify_unreducible(self) -> None:
+        polygon = 'POLYGON((0 0, 1 0, 1 1, 0 1, 0 0))'
+        with self.assertRaises(ValueError):
+            batch_simplify(['POINT(12 14)', polygon, 'MULTIPOINT(0 0, 1 1)'], [5, 3, 1])
+
+    def test_batch_simplify_max_points_length_mismatch(self) -> None:
+        with self.assertRaises(AssertionError):
+            batch_simplify(target_wkt, [20] * (len(target_wkt) + 1))
+
+    def test_batch_simplify_vectorize(self) -> None:
+        max_points = 20
+        simplified, _, _ = batch_simplify(target_wkt, max_points)
+        vectorized = [vectorize_wkt(wkt, max_points, fixed_size=True) for wkt in simplified]
+        self.assertEqual(np.array(vectorized).shape, (len(target_wkt), max_points, GEO_VECTOR_LEN))
@@ -1,5 +1,5 @@
 import re
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple, Union
 
 import shapely
 from shapely import wkt, geometry
@@ -20,6 +20,7 @@ ONE_HOT_LEN = 2 + RENDER_LEN  # Length of the one-hot encoded part
 STOP_INDEX = RENDER_INDEX + 1  # Stop index for the first geometry. A second one follows
 GEO_VECTOR_LEN = STOP_INDEX + 2  # The length needed to describe the features of a geometry point
 FULL_STOP_INDEX = -1  # Full stop index. No more points to follow
+MAX_LOG_TOLERANCE = math.log10(np.finfo(float).max)  # Simplification tolerances beyond this are not finite
 
 action_types = ["render", "stop", "full stop"]
 wkt_start = {
@@ -203,3 +204,47 @@ def recursive_simplify(max_points: int, shape: shapely.geometry) -> shapely.geom
         tolerance = math.pow(10, log_tolerance)
         shape = shape.simplify(tolerance)
     return shape
+
+
+def batch_simplify(
+        geom_wkts: Sequence[str],
+        max_points: Union[int, Sequence[int]]) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """
+    Reduces the number of points of every geometry in a set that exceeds its max_points budget, in one batch.
+    Uses the same successive tolerance search as recursive_simplify, but refines the tolerances of all over-budget
+    geometries in lockstep with array-level shapely operations instead of one Python loop per geometry.
+    :param geom_wkts: a 1d array of well-known text geometries
+    :param max_points: the maximum number of points, either as a scalar for all geometries or one per geometry
+    :return: a tuple of the (simplified) well-known text geometries, the final simplification tolerance per
+        geometry (0 if left untouched) and the number of points removed per geometry
+    :raises ValueError: if simplification cannot bring one or more geometries within their max_points budget
+    """
+    budgets = np.asarray(max_points, dtype=int)
+    assert budgets.ndim == 0 or budgets.shape == (len(geom_wkts),), \
+        'The max_points parameter should be a scalar or have one entry per geometry, but got {} entries ' \
+        'for {} geometries.'.format(budgets.size, len(geom_wkts))
+
+    shapes = shapely.from_wkt(np.asarray(geom_wkts, dtype=object))
+    budgets = np.broadcast_to(budgets, shapes.shape)
+    num_points = shapely.get_num_coordinates(shapes)
+
+    pending = np.flatnonzero(num_points > budgets)
+    log_tolerances = np.full(pending.shape, -10.0)  # Log scale
+    tolerances = np.zeros(shapes.shape)
+    simplified = shapes.copy()
+    simplified_wkts = list(geom_wkts)
+
+    while pending.size:
+        if log_tolerances[0] > MAX_LOG_TOLERANCE:  # tolerances are refined in lockstep, so all pending are stuck
+            raise ValueError('Unable to reduce the number of points below max_points for the geometries at '
+                             'index {}'.format(pending.tolist()))
+        tolerances[pending] = np.power(10, log_tolerances)
+        simplified[pending] = shapely.simplify(simplified[pending], tolerances[pending])
+        exceeds = shapely.get_num_coordinates(simplified[pending]) > budgets[pending]
+        for index in pending[~exceeds]:
+            simplified_wkts[index] = simplified[index].wkt
+        pending = pending[exceeds]
+        log_tolerances = log_tolerances[exceeds] + 0.5
+
+    vertices_removed = num_points - shapely.get_num_coordinates(simplified)
+    return simplified_wkts, tolerances, vertices_removed
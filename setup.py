@@ -8,7 +8,7 @@ with open('Pipfile', 'rt') as p:
     dependencies_toml = p.read()
     dependencies = toml.loads(dependencies_toml)
     dependencies = dependencies['packages']
-    dependency_packages = dependencies.keys()
+    dependency_packages = [name + ('' if version == '*' else version) for name, version in dependencies.items()]
 
 
 setuptools.setup(